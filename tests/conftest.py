@@ -0,0 +1,105 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from pathlib import Path
+import sys
+
+# Add src directory to path so we can import app
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from app import app, activities
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client for the FastAPI app, shared across the session"""
+    # Entering the client keeps one event loop portal open for every request
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+# Initial activities state, built once and copied into place for each test
+_ORIGINAL_STATE = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+    },
+    "Soccer Team": {
+        "description": "Competitive soccer training and matches",
+        "schedule": "Mondays, Wednesdays, 4:00 PM - 6:00 PM",
+        "max_participants": 22,
+        "participants": ["noah@mergington.edu", "liam@mergington.edu"]
+    },
+    "Track & Field": {
+        "description": "Running, jumping and throwing events; conditioning and meets",
+        "schedule": "Tuesdays, Thursdays, 4:00 PM - 5:30 PM",
+        "max_participants": 25,
+        "participants": ["ava@mergington.edu", "isabella@mergington.edu"]
+    },
+    "Art Club": {
+        "description": "Drawing, painting, and mixed-media workshops",
+        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 18,
+        "participants": ["charlotte@mergington.edu", "amelia@mergington.edu"]
+    },
+    "Drama Club": {
+        "description": "Acting, stagecraft, and production of school plays",
+        "schedule": "Thursdays, 3:30 PM - 5:30 PM",
+        "max_participants": 20,
+        "participants": ["mason@mergington.edu", "lucas@mergington.edu"]
+    },
+    "Debate Team": {
+        "description": "Competitive debate practice and tournament preparation",
+        "schedule": "Mondays, 4:00 PM - 5:30 PM",
+        "max_participants": 16,
+        "participants": ["grace@mergington.edu", "henry@mergington.edu"]
+    },
+    "Science Club": {
+        "description": "Hands-on experiments, research projects, and science fairs",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 20,
+        "participants": ["mia@mergington.edu", "jack@mergington.edu"]
+    }
+}
+
+
+def _restore_activities():
+    """Replace the app's activities with a fresh copy of the initial state"""
+    activities.clear()
+    activities.update(
+        (name, {**info, "participants": info["participants"][:]})
+        for name, info in _ORIGINAL_STATE.items()
+    )
+
+
+@pytest.fixture(scope="session")
+def activities_snapshot(client):
+    """Fetch the initial /activities payload once for read-only tests"""
+    response = client.get("/activities")
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture
+def reset_activities():
+    """Reset activities to initial state around tests that mutate them"""
+    _restore_activities()
+    yield
+    _restore_activities()
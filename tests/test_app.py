@@ -2,95 +2,43 @@
 Tests for the Mergington High School Activities API
 """
 
+from urllib.parse import quote
+
 import pytest
-from fastapi.testclient import TestClient
-from pathlib import Path
-import sys
+from fastapi import HTTPException
+from pydantic import TypeAdapter
+from typing_extensions import TypedDict
 
-# Add src directory to path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from app import activities, signup_for_activity, unregister_from_activity
 
-from app import app
 
+class Activity(TypedDict):
+    """Expected shape of a single activity in the /activities payload"""
+    description: str
+    schedule: str
+    max_participants: int
+    participants: list[str]
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
 
+_ACTIVITIES_ADAPTER = TypeAdapter(dict[str, Activity])
 
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    from app import activities
-    
-    # Store original state
-    original = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Soccer Team": {
-            "description": "Competitive soccer training and matches",
-            "schedule": "Mondays, Wednesdays, 4:00 PM - 6:00 PM",
-            "max_participants": 22,
-            "participants": ["noah@mergington.edu", "liam@mergington.edu"]
-        },
-        "Track & Field": {
-            "description": "Running, jumping and throwing events; conditioning and meets",
-            "schedule": "Tuesdays, Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 25,
-            "participants": ["ava@mergington.edu", "isabella@mergington.edu"]
-        },
-        "Art Club": {
-            "description": "Drawing, painting, and mixed-media workshops",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["charlotte@mergington.edu", "amelia@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Acting, stagecraft, and production of school plays",
-            "schedule": "Thursdays, 3:30 PM - 5:30 PM",
-            "max_participants": 20,
-            "participants": ["mason@mergington.edu", "lucas@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Competitive debate practice and tournament preparation",
-            "schedule": "Mondays, 4:00 PM - 5:30 PM",
-            "max_participants": 16,
-            "participants": ["grace@mergington.edu", "henry@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Hands-on experiments, research projects, and science fairs",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": ["mia@mergington.edu", "jack@mergington.edu"]
-        }
-    }
-    
-    # Clear and reset activities
-    activities.clear()
-    activities.update(original)
-    
-    yield
-    
-    # Reset again after test
-    activities.clear()
-    activities.update(original)
+
+# Enough distinct seed emails to fill the largest activity
+_SEED_EMAILS = tuple(
+    f"seed{i}@mergington.edu"
+    for i in range(max(info["max_participants"] for info in activities.values()))
+)
+
+# Percent-encoded endpoint paths for each activity, built once per module
+_SIGNUP_URLS = {name: f"/activities/{quote(name)}/signup" for name in activities}
+_UNREGISTER_URLS = {name: f"/activities/{quote(name)}/unregister" for name in activities}
+
+
+def _fill(activity_name, count):
+    """Add seed participants to an activity directly, bypassing the API"""
+    emails = _SEED_EMAILS[:count]
+    activities[activity_name]["participants"].extend(emails)
+    return emails
 
 
 class TestRoot:
@@ -106,36 +54,35 @@ class TestRoot:
 class TestGetActivities:
     """Tests for the GET /activities endpoint"""
     
-    def test_get_all_activities(self, client):
+    def test_get_all_activities(self, activities_snapshot):
         """Test retrieving all activities"""
-        response = client.get("/activities")
-        assert response.status_code == 200
-        
-        activities_data = response.json()
+        activities_data = activities_snapshot
         assert "Chess Club" in activities_data
         assert "Programming Class" in activities_data
         assert activities_data["Chess Club"]["description"] == "Learn strategies and compete in chess tournaments"
     
-    def test_activity_has_required_fields(self, client):
+    def test_activity_has_required_fields(self, activities_snapshot):
         """Test that activities have all required fields"""
-        response = client.get("/activities")
-        activities_data = response.json()
-        
-        for activity_name, activity_info in activities_data.items():
-            assert "description" in activity_info
-            assert "schedule" in activity_info
-            assert "max_participants" in activity_info
-            assert "participants" in activity_info
-            assert isinstance(activity_info["participants"], list)
+        # Raises a ValidationError naming each offending activity and field
+        _ACTIVITIES_ADAPTER.validate_python(activities_snapshot, strict=True)
+
+
+@pytest.fixture
+def full_activity(request, reset_activities):
+    """Fill the parametrized activity to capacity and return its name"""
+    info = activities[request.param]
+    _fill(request.param, info["max_participants"] - len(info["participants"]))
+    return request.param
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestSignup:
     """Tests for the POST /activities/{activity_name}/signup endpoint"""
     
     def test_successful_signup(self, client):
         """Test successful signup for an activity"""
         response = client.post(
-            "/activities/Chess Club/signup?email=newstudent@mergington.edu"
+            _SIGNUP_URLS["Chess Club"], params={"email": "newstudent@mergington.edu"}
         )
         assert response.status_code == 200
         
@@ -148,56 +95,27 @@ class TestSignup:
         activities_data = activities_response.json()
         assert "newstudent@mergington.edu" in activities_data["Chess Club"]["participants"]
     
-    def test_signup_nonexistent_activity(self, client):
-        """Test signup for non-existent activity returns 404"""
-        response = client.post(
-            "/activities/Nonexistent Club/signup?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
-    
-    def test_duplicate_signup_prevention(self, client):
-        """Test that duplicate signups are prevented"""
-        # Try to sign up an already-registered student
-        response = client.post(
-            "/activities/Chess Club/signup?email=michael@mergington.edu"
-        )
-        assert response.status_code == 400
-        assert "already signed up" in response.json()["detail"].lower()
-    
-    def test_activity_full_prevention(self, client):
+    @pytest.mark.parametrize(
+        "full_activity", ["Soccer Team", "Debate Team", "Chess Club"], indirect=True
+    )
+    def test_activity_full_prevention(self, full_activity):
         """Test that signup is prevented when activity is full"""
-        # Create a nearly-full activity for testing
-        response = client.get("/activities")
-        activities_data = response.json()
-        
-        # Find an activity we can fill up
-        # Soccer Team has max 22 and 2 participants, so we need to add 20 more
-        for i in range(20):
-            client.post(
-                f"/activities/Soccer Team/signup?email=student{i}@mergington.edu"
-            )
-        
-        # Now try to add one more (should still work - at capacity)
-        response = client.post(
-            "/activities/Soccer Team/signup?email=full@mergington.edu"
-        )
-        assert response.status_code == 400
-        assert "full" in response.json()["detail"].lower()
+        with pytest.raises(HTTPException) as exc_info:
+            signup_for_activity(full_activity, "full@mergington.edu")
+        assert exc_info.value.status_code == 400
+        assert "full" in exc_info.value.detail.lower()
     
     def test_signup_multiple_activities(self, client):
         """Test that a student can sign up for multiple activities"""
         email = "multiplesignup@mergington.edu"
         
         # Sign up for first activity
-        response1 = client.post(
-            f"/activities/Chess Club/signup?email={email}"
-        )
+        response1 = client.post(_SIGNUP_URLS["Chess Club"], params={"email": email})
         assert response1.status_code == 200
         
         # Sign up for second activity
         response2 = client.post(
-            f"/activities/Programming Class/signup?email={email}"
+            _SIGNUP_URLS["Programming Class"], params={"email": email}
         )
         assert response2.status_code == 200
         
@@ -208,17 +126,18 @@ class TestSignup:
         assert email in activities_data["Programming Class"]["participants"]
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestUnregister:
     """Tests for the DELETE /activities/{activity_name}/unregister endpoint"""
     
     def test_successful_unregister(self, client):
         """Test successful unregistration from an activity"""
         # Sign up first
-        client.post("/activities/Chess Club/signup?email=temp@mergington.edu")
+        client.post(_SIGNUP_URLS["Chess Club"], params={"email": "temp@mergington.edu"})
         
         # Then unregister
         response = client.delete(
-            "/activities/Chess Club/unregister?email=temp@mergington.edu"
+            _UNREGISTER_URLS["Chess Club"], params={"email": "temp@mergington.edu"}
         )
         assert response.status_code == 200
         assert "Unregistered" in response.json()["message"]
@@ -228,34 +147,43 @@ class TestUnregister:
         activities_data = activities_response.json()
         assert "temp@mergington.edu" not in activities_data["Chess Club"]["participants"]
     
-    def test_unregister_nonexistent_activity(self, client):
-        """Test unregister from non-existent activity returns 404"""
-        response = client.delete(
-            "/activities/Nonexistent Club/unregister?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-    
-    def test_unregister_not_signed_up_student(self, client):
-        """Test unregister for student not signed up returns 400"""
-        response = client.delete(
-            "/activities/Chess Club/unregister?email=notstudent@mergington.edu"
-        )
-        assert response.status_code == 400
-        assert "not signed up" in response.json()["detail"].lower()
-    
-    def test_unregister_original_participant(self, client):
+    def test_unregister_original_participant(self):
         """Test unregistering an originally registered participant"""
-        response = client.delete(
-            "/activities/Chess Club/unregister?email=michael@mergington.edu"
-        )
-        assert response.status_code == 200
+        unregister_from_activity("Chess Club", "michael@mergington.edu")
         
         # Verify removal
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "michael@mergington.edu" not in activities_data["Chess Club"]["participants"]
-
-
+        assert "michael@mergington.edu" not in activities["Chess Club"]["participants"]
+
+
+class TestErrorResponses:
+    """Tests for error responses from the signup and unregister endpoints"""
+    
+    @pytest.mark.parametrize("method, url, email, status, detail", [
+        pytest.param(
+            "post", f"/activities/{quote('Nonexistent Club')}/signup", "student@mergington.edu",
+            404, "not found", id="signup-nonexistent-activity",
+        ),
+        pytest.param(
+            "post", _SIGNUP_URLS["Chess Club"], "michael@mergington.edu",
+            400, "already signed up", id="signup-duplicate",
+        ),
+        pytest.param(
+            "delete", f"/activities/{quote('Nonexistent Club')}/unregister", "student@mergington.edu",
+            404, "not found", id="unregister-nonexistent-activity",
+        ),
+        pytest.param(
+            "delete", _UNREGISTER_URLS["Chess Club"], "notstudent@mergington.edu",
+            400, "not signed up", id="unregister-not-signed-up",
+        ),
+    ])
+    def test_error_response(self, client, method, url, email, status, detail):
+        """Test that invalid requests return the expected status and detail"""
+        response = client.request(method, url, params={"email": email})
+        assert response.status_code == status
+        assert detail in response.json()["detail"].lower()
+
+
+@pytest.mark.usefixtures("reset_activities")
 class TestIntegration:
     """Integration tests for signup and unregister workflows"""
     
@@ -265,30 +193,27 @@ class TestIntegration:
         activity = "Programming Class"
         
         # Initial check
-        response = client.get("/activities")
-        initial_count = len(response.json()[activity]["participants"])
+        initial_count = len(activities[activity]["participants"])
         
         # Sign up
-        signup_response = client.post(
-            f"/activities/{activity}/signup?email={email}"
-        )
+        signup_response = client.post(_SIGNUP_URLS[activity], params={"email": email})
         assert signup_response.status_code == 200
         
         # Verify signup
-        response = client.get("/activities")
-        assert len(response.json()[activity]["participants"]) == initial_count + 1
-        assert email in response.json()[activity]["participants"]
+        participants = activities[activity]["participants"]
+        assert len(participants) == initial_count + 1
+        assert email in participants
         
         # Unregister
         unregister_response = client.delete(
-            f"/activities/{activity}/unregister?email={email}"
+            _UNREGISTER_URLS[activity], params={"email": email}
         )
         assert unregister_response.status_code == 200
         
         # Verify unregister
-        response = client.get("/activities")
-        assert len(response.json()[activity]["participants"]) == initial_count
-        assert email not in response.json()[activity]["participants"]
+        participants = activities[activity]["participants"]
+        assert len(participants) == initial_count
+        assert email not in participants
     
     def test_capacity_management(self, client):
         """Test that capacity is properly managed during signup and unregister"""
@@ -296,39 +221,30 @@ class TestIntegration:
         
         # Get initial info
         response = client.get("/activities")
-        initial_participants = len(response.json()[activity]["participants"])
-        max_participants = response.json()[activity]["max_participants"]
+        info = response.json()[activity]
+        initial_participants = len(info["participants"])
+        max_participants = info["max_participants"]
         spots_available = max_participants - initial_participants
         
         # Fill up remaining spots
-        emails = []
-        for i in range(spots_available):
-            email = f"capacity_test{i}@mergington.edu"
-            emails.append(email)
-            response = client.post(
-                f"/activities/{activity}/signup?email={email}"
-            )
-            assert response.status_code == 200
+        emails = _fill(activity, spots_available)
         
         # Verify activity is full
-        response = client.get("/activities")
-        assert len(response.json()[activity]["participants"]) == max_participants
+        assert len(activities[activity]["participants"]) == max_participants
         
         # Try to add one more (should fail)
         response = client.post(
-            "/activities/Debate Team/signup?email=extra@mergington.edu"
+            _SIGNUP_URLS[activity], params={"email": "extra@mergington.edu"}
         )
         assert response.status_code == 400
         assert "full" in response.json()["detail"].lower()
         
         # Unregister one participant
-        response = client.delete(
-            f"/activities/{activity}/unregister?email={emails[0]}"
-        )
+        response = client.delete(_UNREGISTER_URLS[activity], params={"email": emails[0]})
         assert response.status_code == 200
         
         # Now signup should work again
         response = client.post(
-            "/activities/Debate Team/signup?email=extra@mergington.edu"
+            _SIGNUP_URLS[activity], params={"email": "extra@mergington.edu"}
         )
         assert response.status_code == 200